@@ -70,7 +70,7 @@ def update_changelog(
             last_version.url += planned_tag
             last_version.compare_url = last_version.compare_url.replace("HEAD", planned_tag)
 
-    with open(inplace_file, "r") as changelog_file:
+    with open(inplace_file) as changelog_file:
         lines = changelog_file.read().splitlines()
 
     last_released = _latest(lines, re.compile(version_regex))
@@ -340,18 +340,22 @@ def coverage(ctx):
 
 
 @duty
-def test(ctx, match: str = ""):
+def test(ctx, match: str = "", last_failed: bool = False):
     """
     Run the test suite.
 
     Arguments:
         ctx: The context instance (passed automatically).
         match: A pytest expression to filter selected tests.
+        last_failed: Whether to only re-run the tests that failed during the previous run.
     """
     py_version = f"{sys.version_info.major}{sys.version_info.minor}"
     os.environ["COVERAGE_FILE"] = f".coverage.{py_version}"
+    args = ["pytest", "-c", "config/pytest.ini", "-n", "auto", "-k", match]
+    if last_failed:
+        args.append("--last-failed")
     ctx.run(
-        ["pytest", "-c", "config/pytest.ini", "-n", "auto", "-k", match, "tests"],
+        [*args, "tests"],
         title="Running tests",
         pty=PTY,
     )
@@ -16,7 +16,6 @@ from __future__ import annotations
 import argparse
 import sys
 from contextlib import contextmanager
-from typing import List, Optional
 
 from colorama import init
 
@@ -159,16 +158,9 @@ def _get_depth(opts, packages):
     return opts.depth or guess_depth(packages)
 
 
-def _get_packages(opts):  # noqa: WPS231
-    packages = []
-    for arg in opts.packages:
-        if "," in arg:
-            for package in arg.split(","):
-                if package not in packages:
-                    packages.append(package)
-        elif arg not in packages:
-            packages.append(arg)
-    return packages
+def _get_packages(opts):
+    # dicts preserve insertion order: deduplicate while keeping the first occurrence
+    return list(dict.fromkeys(package for arg in opts.packages for package in arg.split(",")))
 
 
 def _run(opts, dsm):
@@ -185,7 +177,7 @@ def _run(opts, dsm):
             dsm.print_graph(format=opts.format, output=output, depth=depth, indent=indent)
 
 
-def main(args: Optional[List[str]] = None) -> int:  # noqa: WPS231
+def main(args: list[str] | None = None) -> int:  # noqa: WPS231
     """
     Run the main program.
 
@@ -14,16 +14,85 @@ from __future__ import annotations
 import ast
 import json
 import sys
-from os import listdir
-from os.path import isdir, isfile, join, splitext
+from os import scandir, stat
+from os.path import isfile, join, splitext
 from pathlib import Path
-from typing import List
 
 from dependenpy.finder import Finder, PackageSpec
 from dependenpy.helpers import PrintMixin
 from dependenpy.node import LeafNode, NodeMixin, RootNode
 
 
+def _find_imports(ast_body) -> list[tuple[int, str | None, str, int]]:  # noqa: WPS231
+    """
+    Return all the import statements given an AST body (AST nodes), unresolved.
+
+    Args:
+        ast_body (compiled code's body): the body to filter.
+
+    Returns:
+        The level, module, name and line number of each import.
+        Plain `import` statements have a level of 0 and no module.
+    """
+    imports: list[tuple[int, str | None, str, int]] = []
+    for node in ast_body:
+        if isinstance(node, ast.Import):
+            imports.extend((0, None, name.name, node.lineno) for name in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.extend((node.level, node.module, name.name, node.lineno) for name in node.names)
+        elif isinstance(node, Module.RECURSIVE_NODES):
+            imports.extend(_find_imports(node.body))
+            if isinstance(node, ast.Try):
+                imports.extend(_find_imports(node.finalbody))
+    return imports
+
+
+_imports_cache: dict[str, tuple[int, tuple[tuple[int, str | None, str, int], ...]]] = {}
+
+
+def _parse_imports(path: str) -> tuple[tuple[int, str | None, str, int], ...]:
+    """
+    Parse a source file and return its unresolved import statements.
+
+    Args:
+        path: Path to the source file.
+
+    Returns:
+        The level, module, name and line number of each import.
+    """
+    code = Path(path).read_text(encoding="utf-8")
+    try:
+        body = ast.parse(code).body
+    except SyntaxError:
+        try:  # noqa: WPS505
+            body = ast.parse(code.encode("utf-8")).body
+        except SyntaxError:
+            return ()
+    return tuple(_find_imports(body))
+
+
+def _read_imports(path: str) -> tuple[tuple[int, str | None, str, int], ...]:
+    """
+    Return the unresolved import statements of a source file, parsing it only when needed.
+
+    Results are cached per path along with the file modification time:
+    files modified in the meantime are parsed again and replace their cache entry.
+
+    Args:
+        path: Path to the source file.
+
+    Returns:
+        The level, module, name and line number of each import.
+    """
+    mtime = stat(path).st_mtime_ns
+    cached = _imports_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    imports = _parse_imports(path)
+    _imports_cache[path] = (mtime, imports)
+    return imports
+
+
 class DSM(RootNode, NodeMixin, PrintMixin):
     """
     DSM-capable class.
@@ -118,8 +187,8 @@ class Package(RootNode, LeafNode, NodeMixin, PrintMixin):  # noqa: WPS215
         name: str,
         path: str,
         dsm: DSM = None,
-        package: "Package" = None,
-        limit_to: List[str] = None,
+        package: Package = None,
+        limit_to: list[str] = None,
         build_tree: bool = True,
         build_dependencies: bool = True,
         enforce_init: bool = True,
@@ -200,28 +269,29 @@ class Package(RootNode, LeafNode, NodeMixin, PrintMixin):  # noqa: WPS215
 
     def build_tree(self):  # noqa: WPS231
         """Build the tree for this package."""
-        for module in listdir(self.path):
-            abs_m = join(self.path, module)
-            if isfile(abs_m) and module.endswith(".py"):
-                name = splitext(module)[0]
-                if not self.limit_to or name in self.limit_to:
-                    self.modules.append(Module(name, abs_m, self.dsm, self))
-            elif isdir(abs_m):
-                if isfile(join(abs_m, "__init__.py")) or not self.enforce_init:
-                    heads, new_limit_to = self.split_limits_heads()
-                    if not heads or module in heads:
-                        self.packages.append(
-                            Package(
-                                module,
-                                abs_m,
-                                self.dsm,
-                                self,
-                                new_limit_to,
-                                build_tree=True,
-                                build_dependencies=False,
-                                enforce_init=self.enforce_init,
+        heads, new_limit_to = self.split_limits_heads()
+        with scandir(self.path) as entries:
+            for entry in entries:
+                module, abs_m = entry.name, entry.path
+                if module.endswith(".py") and entry.is_file():
+                    name = splitext(module)[0]
+                    if not self.limit_to or name in self.limit_to:
+                        self.modules.append(Module(name, abs_m, self.dsm, self))
+                elif entry.is_dir():
+                    if isfile(join(abs_m, "__init__.py")) or not self.enforce_init:
+                        if not heads or module in heads:
+                            self.packages.append(
+                                Package(
+                                    module,
+                                    abs_m,
+                                    self.dsm,
+                                    self,
+                                    new_limit_to,
+                                    build_tree=True,
+                                    build_dependencies=False,
+                                    enforce_init=self.enforce_init,
+                                )
                             )
-                        )
 
     def cardinal(self, to) -> int:
         """
@@ -363,21 +433,14 @@ class Module(LeafNode, NodeMixin, PrintMixin):  # noqa: WPS338
         """
         Read the source code and return all the import statements.
 
+        Parsed files are cached as long as their modification time does not change.
+
         Returns:
             list of dict: the import statements.
         """
-        code = Path(self.path).read_text(encoding="utf-8")
-        try:
-            body = ast.parse(code).body
-        except SyntaxError:
-            code = code.encode("utf-8")  # type: ignore[assignment]
-            try:  # noqa: WPS505
-                body = ast.parse(code).body
-            except SyntaxError:
-                return []
-        return self.get_imports(body)
+        return self._resolve_imports(_read_imports(self.path))
 
-    def get_imports(self, ast_body) -> list[dict]:  # noqa: WPS231,WPS615
+    def get_imports(self, ast_body) -> list[dict]:
         """
         Return all the import statements given an AST body (AST nodes).
 
@@ -387,21 +450,25 @@ class Module(LeafNode, NodeMixin, PrintMixin):  # noqa: WPS338
         Returns:
             The import statements.
         """
-        imports: list[dict] = []
-        for node in ast_body:
-            if isinstance(node, ast.Import):
-                imports.extend({"target": name.name, "lineno": node.lineno} for name in node.names)
-            elif isinstance(node, ast.ImportFrom):
-                for name in node.names:
-                    abs_name = self.absolute_name(self.depth - node.level) + "." if node.level > 0 else ""
-                    node_module = node.module + "." if node.module else ""
-                    name = abs_name + node_module + name.name  # type: ignore[assignment]
-                    imports.append({"target": name, "lineno": node.lineno})
-            elif isinstance(node, Module.RECURSIVE_NODES):
-                imports.extend(self.get_imports(node.body))
-                if isinstance(node, ast.Try):
-                    imports.extend(self.get_imports(node.finalbody))
-        return imports
+        return self._resolve_imports(_find_imports(ast_body))
+
+    def _resolve_imports(self, imports):
+        """
+        Return the import statements with their absolute targets.
+
+        Args:
+            imports (list of tuple): level, module, name and line number of each import.
+
+        Returns:
+            list of dict: the import statements.
+        """
+        resolved = []
+        for level, module, name, lineno in imports:
+            abs_name = self.absolute_name(self.depth - level) + "." if level > 0 else ""
+            node_module = module + "." if module else ""
+            # interned: the same targets are looked up again and again in the nodes' target caches
+            resolved.append({"target": sys.intern(abs_name + node_module + name), "lineno": lineno})
+        return resolved
 
     def cardinal(self, to) -> int:
         """
@@ -416,13 +483,15 @@ class Module(LeafNode, NodeMixin, PrintMixin):  # noqa: WPS338
         return len([dep for dep in self.dependencies if not dep.external and dep.target in to])
 
 
-class Dependency(object):
+class Dependency:
     """
     Dependency class.
 
     Represent a dependency from a module to another.
     """
 
+    __slots__ = ("source", "lineno", "target", "what")
+
     def __init__(self, source, lineno, target, what=None):
         """
         Initialization method.
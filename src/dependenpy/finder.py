@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from importlib.util import find_spec
 from os.path import basename, exists, isdir, isfile, join, splitext
-from typing import Any, List, Type
+from typing import Any
 
 
-class PackageSpec(object):
+class PackageSpec:
     """Holder for a package specification (given as argument to DSM)."""
 
     def __init__(self, name, path, limit_to=None):
@@ -67,7 +67,7 @@ class PackageSpec(object):
         return list(new_specs.values())
 
 
-class PackageFinder(object):
+class PackageFinder:
     """Abstract package finder class."""
 
     def find(self, package: str, **kwargs: Any) -> PackageSpec | None:
@@ -146,14 +146,14 @@ class InstalledPackageFinder(PackageFinder):
         return None
 
 
-class Finder(object):
+class Finder:
     """
     Main package finder class.
 
     Initialize it with a list of package finder classes (not instances).
     """
 
-    def __init__(self, finders: List[Type] = None):
+    def __init__(self, finders: list[type] = None):
         """
         Initialization method.
 
@@ -11,7 +11,7 @@ TEXT = "text"
 FORMAT = (CSV, JSON, TEXT)
 
 
-class PrintMixin(object):
+class PrintMixin:
     """Print mixin class."""
 
     def print(self, format: str | None = TEXT, output: IO = sys.stdout, **kwargs: Any):  # noqa: A002,A003
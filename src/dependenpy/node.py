@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from dependenpy.dsm import Module, Package
 
 
-class NodeMixin(object):
+class NodeMixin:
     """Shared code between DSM, Package and Module."""
 
     @property
@@ -46,7 +46,7 @@ class NodeMixin(object):
         return False
 
 
-class RootNode(object):
+class RootNode:
     """Shared code between DSM and Package."""
 
     def __init__(self, build_tree=True):
@@ -138,16 +138,25 @@ class RootNode(object):
         Returns:
             The sub-modules.
         """
-        submodules = []
-        submodules.extend(self.modules)
-        for package in self.packages:
-            submodules.extend(package.submodules)
+        submodules: list[Module] = []
+        self._collect_submodules(submodules)
         return submodules
 
     def build_tree(self):
         """To be overridden."""  # noqa: DAR401
         raise NotImplementedError
 
+    def _collect_submodules(self, submodules):
+        """
+        Append all sub-modules of the node to the given list, recursively.
+
+        Args:
+            submodules (list of Module): the list to extend.
+        """
+        submodules.extend(self.modules)
+        for package in self.packages:
+            package._collect_submodules(submodules)  # noqa: WPS437
+
     def _contains(self, item):
         """
         Whether given item is contained inside the node modules/packages.
@@ -335,6 +344,7 @@ class RootNode(object):
         Returns:
             An instance of Graph.
         """
+        depth = max(depth, 0)  # all depths lower than 1 give the same graph
         if depth not in self._graph_cache:
             self._graph_cache[depth] = Graph(self, depth=depth)
         return self._graph_cache[depth]
@@ -349,6 +359,7 @@ class RootNode(object):
         Returns:
             An instance of Matrix.
         """
+        depth = max(depth, 0)  # all depths lower than 1 give the same matrix
         if depth not in self._matrix_cache:
             self._matrix_cache[depth] = Matrix(self, depth=depth)  # type: ignore[arg-type]
         return self._matrix_cache[depth]
@@ -365,12 +376,13 @@ class RootNode(object):
         return self._treemap_cache
 
 
-class LeafNode(object):
+class LeafNode:
     """Shared code between Package and Module."""
 
     def __init__(self):
         """Initialization method."""
         self._depth_cache = None
+        self._absolute_name_cache = {}
 
     def __str__(self):
         return self.absolute_name()
@@ -420,8 +432,10 @@ class LeafNode(object):
         """
         node: Package
         node, node_depth = self, self.depth  # type: ignore[assignment]
-        if depth < 1:
+        if depth < 1 or depth > node_depth:
             depth = node_depth
+        if depth in self._absolute_name_cache:
+            return self._absolute_name_cache[depth]
         while node_depth > depth and node.package is not None:
             node = node.package
             node_depth -= 1
@@ -429,4 +443,5 @@ class LeafNode(object):
         while node is not None:
             names.append(node.name)
             node = node.package  # type: ignore[assignment]
-        return ".".join(reversed(names))
+        self._absolute_name_cache[depth] = sys.intern(".".join(reversed(names)))
+        return self._absolute_name_cache[depth]
@@ -9,7 +9,7 @@ try:
     import archan
 except ImportError:
 
-    class InternalDependencies(object):
+    class InternalDependencies:
         """Empty dependenpy provider."""
 
 else:
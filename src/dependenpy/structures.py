@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-import copy
+import csv
+import io
 import json
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 from colorama import Style
@@ -14,6 +16,28 @@ if TYPE_CHECKING:
     from dependenpy.dsm import DSM, Module, Package
 
 
+def _containers(node: Package | Module) -> list[Package | Module]:
+    """
+    Return the nodes containing the given node, as per their `__contains__` methods.
+
+    Arguments:
+        node: A package or module.
+
+    Returns:
+        The node itself, its `__init__` module if it is a package, and its parent packages.
+    """
+    containers = [node]
+    if node.ispackage:
+        init = node.get("__init__")  # type: ignore[union-attr]
+        if init is not None:
+            containers.append(init)
+    package = node.package
+    while package is not None:
+        containers.append(package)
+        package = package.package
+    return containers
+
+
 class Matrix(PrintMixin):
     """
     Matrix class.
@@ -46,6 +70,7 @@ class Matrix(PrintMixin):
             keys = modules
         else:
             keys = []
+            seen = set()
             for module in modules:
                 if module.depth <= depth:
                     keys.append(module)
@@ -53,30 +78,33 @@ class Matrix(PrintMixin):
                 package = module.package
                 while package.depth > depth and package.package and package not in nodes:
                     package = package.package
-                if package not in keys:
+                if package not in seen:
+                    seen.add(package)
                     keys.append(package)
 
         size = len(keys)
         data = [[0] * size for _ in range(size)]  # noqa: WPS435
         keys = sorted(keys, key=lambda key: key.absolute_name())
 
-        if depth < 1:
-            for index, key in enumerate(keys):  # noqa: WPS440
-                key.index = index  # type: ignore[attr-defined]
-            for index, key in enumerate(keys):  # noqa: WPS440
-                for dep in key.dependencies:
-                    if dep.external:
-                        continue
-                    if dep.target.ismodule and dep.target in keys:
-                        data[index][dep.target.index] += 1
-                    elif dep.target.ispackage:
-                        init = dep.target.get("__init__")
-                        if init is not None and init in keys:
-                            data[index][init.index] += 1
-        else:
-            for row, row_key in enumerate(keys):
-                for col, col_key in enumerate(keys):
-                    data[row][col] = row_key.cardinal(to=col_key)
+        # index keys locally rather than on the nodes, which are shared with the DSM
+        positions: dict[Package | Module, list[int]] = {}
+        for index, key in enumerate(keys):  # noqa: WPS440
+            positions.setdefault(key, []).append(index)
+
+        # project each dependency onto the keys containing its target, at any depth:
+        # with depth < 1 all keys are modules, so only a target module
+        # or the __init__ module of a target package can match
+        columns: dict[Package | Module, list[int]] = {}
+        for row, row_key in enumerate(keys):
+            row_modules = row_key.submodules if row_key.ispackage else [row_key]  # type: ignore[attr-defined]
+            targets = Counter(dep.target for module in row_modules for dep in module.dependencies if not dep.external)
+            line = data[row]
+            for target, count in targets.items():
+                if target not in columns:
+                    containers = _containers(target)
+                    columns[target] = [col for node in containers for col in positions.get(node, ())]
+                for col in columns[target]:
+                    line[col] += count
 
         self.size = size
         self.keys = [key.absolute_name() for key in keys]  # noqa: WPS441
@@ -95,8 +123,8 @@ class Matrix(PrintMixin):
             A new matrix.
         """
         matrix = Matrix()
-        matrix.keys = copy.deepcopy(keys)
-        matrix.data = copy.deepcopy(data)
+        matrix.keys = list(keys)
+        matrix.data = [list(line) for line in data]
         return matrix
 
     @property
@@ -107,14 +135,15 @@ class Matrix(PrintMixin):
         Returns:
             The total number of dependencies.
         """
-        return sum(cell for line in self.data for cell in line)
+        return sum(map(sum, self.data))
 
     def _to_csv(self, **kwargs):
-        text = ["module,", ",".join(self.keys)]
-        for index, key in enumerate(self.keys):
-            line = ",".join(map(str, self.data[index]))
-            text.append(f"{key},{line}")
-        return "\n".join(text)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(["module", ""])
+        writer.writerow(self.keys)
+        writer.writerows([key, *line] for key, line in zip(self.keys, self.data))
+        return buffer.getvalue()[:-1]
 
     def _to_json(self, **kwargs):
         return json.dumps({"keys": self.keys, "data": self.data}, **kwargs)
@@ -123,8 +152,8 @@ class Matrix(PrintMixin):
         if not self.keys or not self.data:
             return ""
         zero = kwargs.pop("zero", "0")
-        max_key_length = max(len(key) for key in self.keys + ["Module"])
-        max_dep_length = max([len(str(col)) for line in self.data for col in line] + [len(zero)])
+        max_key_length = max(len("Module"), max(map(len, self.keys)))
+        max_dep_length = max(len(zero), max((len(str(col)) for line in self.data for col in line), default=0))
         key_col_length = len(str(len(self.keys)))
         key_line_length = max(key_col_length, 2)
         column_length = max(key_col_length, max_dep_length)
@@ -144,10 +173,16 @@ class Matrix(PrintMixin):
         text.append(f"{'─' * column_length}┤")
         text.append("\n")
         # lines
+        zero_cell = f"{zero:>{column_length}}│"
         for index, key in enumerate(self.keys):  # noqa: WPS440
             text.append(f" {key:>{max_key_length}} │ {bold}{index:>{key_line_length}}{reset} │")
-            for value in self.data[index]:
-                text.append((f"{value if value else zero:>{column_length}}│"))
+            line = self.data[index]
+            if any(line):
+                for value in line:
+                    text.append(f"{value:>{column_length}}│" if value else zero_cell)
+            else:
+                # most rows of a dependency matrix are empty: write them at once
+                text.append(zero_cell * len(line))
             text.append("\n")
         text.append("\n")
 
@@ -200,7 +235,7 @@ class TreeMap(PrintMixin):
         return ""
 
 
-class Vertex(object):
+class Vertex:
     """Vertex class. Used in Graph class."""
 
     def __init__(self, name):
@@ -250,7 +285,7 @@ class Vertex(object):
         return Edge(vertex, self, weight)
 
 
-class Edge(object):
+class Edge:
     """Edge class. Used in Graph class."""
 
     def __init__(self, vertex_out, vertex_in, weight=1):
@@ -310,6 +345,8 @@ class Graph(PrintMixin):
         Initialization method.
 
         An intermediary matrix is built to ease the creation of the graph.
+        When the graph is built for a single DSM or package, the matrix
+        cached by this node for the same depth is reused.
 
         Args:
             *nodes (list of DSM/Package/Module):
@@ -319,7 +356,10 @@ class Graph(PrintMixin):
         """
         self.edges = set()
         vertices = []
-        matrix = Matrix(*nodes, depth=depth)
+        if len(nodes) == 1 and (nodes[0].ispackage or nodes[0].isdsm):
+            matrix = nodes[0].as_matrix(depth=depth)
+        else:
+            matrix = Matrix(*nodes, depth=depth)
         for key in matrix.keys:
             vertices.append(Vertex(key))
         for line_index, line in enumerate(matrix.data):
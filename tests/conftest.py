@@ -1 +1,19 @@
 """Configuration for the pytest test suite."""
+
+import pytest
+
+from dependenpy.dsm import DSM
+
+
+@pytest.fixture(scope="session")
+def dsm():
+    """
+    Build the DSM of the internal fixture package once per test session.
+
+    Tests using this fixture must not mutate it:
+    build a new DSM instead when isolation is needed.
+
+    Returns:
+        A fully built DSM.
+    """
+    return DSM("internal")
@@ -7,9 +7,9 @@ from dependenpy import cli
 
 def test_main():
     """Basic CLI test."""
-    with pytest.raises(SystemExit) as exit:  # noqa: PT012
+    with pytest.raises(SystemExit) as exit:
         cli.main([])
-        assert exit.code == 2
+    assert exit.value.code == 2
 
 
 def test_show_help(capsys):
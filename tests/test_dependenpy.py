@@ -1,9 +1,70 @@
 """Tests for main features."""
 
+import json
+import os
+from io import StringIO
+
 import pytest
 
 from dependenpy.cli import main
 from dependenpy.dsm import DSM
+from dependenpy.structures import Matrix
+from tests import FIXTURES_DIR
+
+INTERNAL_NODES = (
+    "internal",
+    "internal.subpackage_a",
+    "internal.subpackage_a.subpackage_1",
+    "internal.subpackage_a.subpackage_1.__init__",
+    "internal.subpackage_a.subpackage_1.module_i",
+    "internal.subpackage_a.__init__",
+    "internal.subpackage_a.module_1",
+    "internal.__init__",
+    "internal.module_a",
+)
+
+INTERNAL_SUBMODULES = frozenset(
+    (
+        "internal.__init__",
+        "internal.module_a",
+        "internal.subpackage_a.__init__",
+        "internal.subpackage_a.module_1",
+        "internal.subpackage_a.subpackage_1.__init__",
+        "internal.subpackage_a.subpackage_1.module_i",
+    )
+)
+
+INTERNAL_DEPENDENCIES = json.loads((FIXTURES_DIR / "internal_dependencies.json").read_text())
+
+
+def _expand(size, cells):
+    matrix = [[0] * size for _ in range(size)]
+    for row, col, value in cells:
+        matrix[row][col] = value
+    return matrix
+
+
+INTERNAL_MATRICES = {
+    0: (
+        sorted(INTERNAL_SUBMODULES),
+        _expand(6, [(0, 0, 1), (1, 0, 1), (1, 2, 1), (1, 4, 1), (3, 5, 1), (5, 1, 1), (5, 3, 2)]),
+    ),
+    1: (["internal"], [[8]]),
+    2: (
+        ["internal.__init__", "internal.module_a", "internal.subpackage_a"],
+        _expand(3, [(0, 0, 1), (1, 0, 1), (1, 2, 2), (2, 1, 1), (2, 2, 3)]),
+    ),
+    3: (
+        [
+            "internal.__init__",
+            "internal.module_a",
+            "internal.subpackage_a.__init__",
+            "internal.subpackage_a.module_1",
+            "internal.subpackage_a.subpackage_1",
+        ],
+        _expand(5, [(0, 0, 1), (1, 0, 1), (1, 2, 1), (1, 4, 1), (3, 4, 1), (4, 1, 1), (4, 3, 2)]),
+    ),
+}
 
 
 @pytest.mark.parametrize(
@@ -26,40 +87,204 @@ def test_main_ok(args):
     assert main(args) == 0
 
 
-def test_main_not_ok():
-    """Main test method."""
-    assert main(["do not exist"]) == 1
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["do not exist"],
+        ["do not exist", "neither does this"],
+        ["do not exist,neither does this"],
+    ],
+)
+def test_main_not_ok(args):
+    """
+    Main test method.
+
+    Arguments:
+        args: Command line arguments.
+    """
+    assert main(args) == 1
+
+
+@pytest.mark.parametrize("item", INTERNAL_NODES)
+def test_tree(dsm, item):
+    """
+    Test the built tree.
 
+    Arguments:
+        dsm: The internal DSM fixture.
+        item: Name of a node expected in the tree.
+    """
+    assert dsm.get(item)
 
-def test_tree():
-    """Test the built tree."""
-    dsm = DSM("internal")
-    items = [
-        "internal",
-        "internal.subpackage_a",
-        "internal.subpackage_a.subpackage_1",
-        "internal.subpackage_a.subpackage_1.__init__",
-        "internal.subpackage_a.subpackage_1.module_i",
-        "internal.subpackage_a.__init__",
-        "internal.subpackage_a.module_1",
-        "internal.__init__",
-        "internal.module_a",
-    ]
-    for item in items:
-        assert dsm.get(item)
 
+def test_submodules(dsm):
+    """
+    Test the sub-modules found in the tree.
+
+    Arguments:
+        dsm: The internal DSM fixture.
+    """
+    assert frozenset(module.absolute_name() for module in dsm.submodules) == INTERNAL_SUBMODULES
+
+
+@pytest.mark.parametrize("module", INTERNAL_DEPENDENCIES.keys())
+def test_dependencies(dsm, module):
+    """
+    Test the dependencies found in each module.
+
+    Arguments:
+        dsm: The internal DSM fixture.
+        module: Absolute name of the module.
+    """
+    assert dsm[module].as_dict()["dependencies"] == INTERNAL_DEPENDENCIES[module]
+
+
+def test_inner_imports(dsm):
+    """
+    Test inner imports.
 
-def test_inner_imports():
-    """Test inner imports."""
-    dsm = DSM("internal")
+    Arguments:
+        dsm: The internal DSM fixture.
+    """
     module_i = dsm["internal.subpackage_a.subpackage_1.module_i"]
     assert len(module_i.dependencies) == 4
     assert module_i.cardinal(to=dsm["internal"]) == 3
 
 
+@pytest.mark.parametrize("depth", INTERNAL_MATRICES.keys())
+def test_matrix(dsm, depth):
+    """
+    Test the matrices built from the shared DSM.
+
+    Arguments:
+        dsm: The internal DSM fixture.
+        depth: Depth of the matrix.
+    """
+    keys, data = INTERNAL_MATRICES[depth]
+    matrix = dsm.as_matrix(depth=depth)
+    assert matrix.keys == keys
+    assert matrix.data == data
+
+
+def test_matrix_cache(dsm):
+    """
+    Test that matrices and graphs are cached per depth.
+
+    Arguments:
+        dsm: The internal DSM fixture.
+    """
+    assert dsm.as_matrix(depth=2) is dsm.as_matrix(depth=2)
+    assert dsm.as_matrix(depth=-1) is dsm.as_matrix(depth=0)
+    assert dsm.as_graph(depth=-1) is dsm.as_graph(depth=0)
+
+
+@pytest.mark.parametrize("depth", INTERNAL_MATRICES.keys())
+def test_matrix_output(dsm, depth):
+    """
+    Test the CSV and JSON outputs of the matrices against the expected data.
+
+    Arguments:
+        dsm: The internal DSM fixture.
+        depth: Depth of the matrix.
+    """
+    keys, data = INTERNAL_MATRICES[depth]
+    matrix = dsm.as_matrix(depth=depth)
+
+    output = StringIO()
+    matrix.print(format="json", output=output)
+    assert json.loads(output.getvalue()) == {"keys": keys, "data": data}
+
+    output = StringIO()
+    matrix.print(format="csv", output=output)
+    lines = ["module,", ",".join(keys)]
+    lines.extend(",".join(map(str, [key, *line])) for key, line in zip(keys, data))
+    assert output.getvalue() == "\n".join(lines) + "\n"
+
+
+def test_matrix_overlapping_nodes(dsm):
+    """
+    Test that modules given twice through overlapping nodes get all their rows and columns filled.
+
+    Arguments:
+        dsm: The internal DSM fixture.
+    """
+    matrix = Matrix(dsm["internal"], dsm["internal.subpackage_a"], depth=0)
+    assert matrix.keys == [
+        "internal.__init__",
+        "internal.module_a",
+        "internal.subpackage_a.__init__",
+        "internal.subpackage_a.__init__",
+        "internal.subpackage_a.module_1",
+        "internal.subpackage_a.module_1",
+        "internal.subpackage_a.subpackage_1.__init__",
+        "internal.subpackage_a.subpackage_1.__init__",
+        "internal.subpackage_a.subpackage_1.module_i",
+        "internal.subpackage_a.subpackage_1.module_i",
+    ]
+    assert matrix.data == _expand(
+        10,
+        [
+            (0, 0, 1),
+            (1, 0, 1),
+            (1, 2, 1),
+            (1, 3, 1),
+            (1, 6, 1),
+            (1, 7, 1),
+            (4, 8, 1),
+            (4, 9, 1),
+            (5, 8, 1),
+            (5, 9, 1),
+            (8, 1, 1),
+            (8, 4, 2),
+            (8, 5, 2),
+            (9, 1, 1),
+            (9, 4, 2),
+            (9, 5, 2),
+        ],
+    )
+
+
+@pytest.mark.parametrize("depth", INTERNAL_MATRICES.keys())
+def test_graph(dsm, depth):
+    """
+    Test the graphs built from the shared DSM.
+
+    Arguments:
+        dsm: The internal DSM fixture.
+        depth: Depth of the graph.
+    """
+    keys, data = INTERNAL_MATRICES[depth]
+    graph = dsm.as_graph(depth=depth)
+    assert {vertex.name for vertex in graph.vertices} == set(keys)
+    assert sum(edge.weight for edge in graph.edges) == sum(map(sum, data))
+
+
 def test_delayed_build():
     """Test delayed build."""
     dsm = DSM("internal", build_tree=False)
     dsm.build_tree()
+    tree = (id(dsm.packages), len(dsm.packages), id(dsm.packages[0]))
     dsm.build_dependencies()
+    assert (id(dsm.packages), len(dsm.packages), id(dsm.packages[0])) == tree
     assert len(dsm.submodules) == 6
+    assert frozenset(module.absolute_name() for module in dsm.submodules) == INTERNAL_SUBMODULES
+
+
+def test_parse_cache_invalidation(tmp_path):
+    """
+    Test that modified files are parsed again.
+
+    Arguments:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    module = package / "module.py"
+    module.write_text("import os\n")
+    assert len(DSM(str(package))["package.module"].dependencies) == 1
+
+    module.write_text("import os\nimport sys\n")
+    stat = module.stat()
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(DSM(str(package))["package.module"].dependencies) == 2